@@ -0,0 +1,42 @@
+"""
+Database Migration: Add Composite (hospital_id, date) Index to EHR Records
+
+This script adds the ix_ehr_hospital_date index to the ehr_records table.
+Every prediction and patient endpoint filters EHR records by hospital and
+orders them by date, so this index turns "latest record" lookups into a
+single index seek and history fetches into range scans. The old
+single-column hospital_id index is redundant with it and is dropped.
+
+New databases get the index automatically via Base.metadata.create_all().
+"""
+
+from sqlalchemy import text
+from app.database import init_db
+
+
+def add_ehr_index():
+    """Add composite hospital/date index to ehr_records table"""
+    
+    migrations = [
+        "CREATE INDEX IF NOT EXISTS ix_ehr_hospital_date ON ehr_records (hospital_id, date);",
+        "DROP INDEX IF EXISTS ix_ehr_records_hospital_id;",
+        "ANALYZE ehr_records;"
+    ]
+    
+    engine = init_db()
+    with engine.begin() as conn:
+        for migration in migrations:
+            try:
+                conn.execute(text(migration))
+                print(f"✅ Executed: {migration[:50]}...")
+            except Exception as e:
+                print(f"⚠️  Warning: {migration[:50]}... - {str(e)}")
+    
+    print("\n✅ Migration completed successfully!")
+    print("EHR records are now indexed by (hospital_id, date).")
+
+
+if __name__ == "__main__":
+    print("🔄 Starting migration: Adding EHR hospital/date index...")
+    print("-" * 60)
+    add_ehr_index()
@@ -48,6 +48,9 @@ def init_db():
             pool_pre_ping=True,
             pool_size=5,
             max_overflow=10,
+            # Compiled SQL cache shared by all sessions; sized above the default
+            # (500) so the per-endpoint statement variants never get evicted
+            query_cache_size=1200,
             connect_args={
                 "connect_timeout": 5,
                 "options": "-c statement_timeout=10000"
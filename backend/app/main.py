@@ -16,6 +16,7 @@ import os
 from dotenv import load_dotenv
 from app.database import init_db
 from app.routers import hospitals, ehr, predictions, auth, public
+from app.services.prediction_service import shutdown_prediction_pool
 
 # Load environment variables
 load_dotenv()
@@ -39,6 +40,11 @@ app = FastAPI(
 def startup_event():
     print("✅ Application started successfully")
 
+@app.on_event("shutdown")
+def shutdown_event():
+    # Stop Prophet worker processes used by multi-hospital comparisons
+    shutdown_prediction_pool()
+
 # Note: Database tables should be created manually or via migration scripts
 # To initialize: run `python -c "from app.database import engine, Base; from app.models import *; Base.metadata.create_all(bind=engine)"`
 
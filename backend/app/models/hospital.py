@@ -6,7 +6,7 @@ This module defines SQLAlchemy ORM models for:
 - EHRRecord: Daily electronic health records with admission/discharge data
 """
 
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, DateTime, Boolean, Text
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, DateTime, Boolean, Text, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from app.database import Base
@@ -58,9 +58,15 @@ class EHRRecord(Base):
     - emergency_cases: Emergency admissions
     """
     __tablename__ = "ehr_records"
+    __table_args__ = (
+        # Composite index backing the "latest record per hospital" lookups
+        # and per-hospital date-range scans used by every prediction endpoint
+        Index("ix_ehr_hospital_date", "hospital_id", "date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    hospital_id = Column(Integer, ForeignKey("hospitals.id"), nullable=False, index=True)
+    # Indexed via ix_ehr_hospital_date, whose leading column is hospital_id
+    hospital_id = Column(Integer, ForeignKey("hospitals.id"), nullable=False)
     date = Column(Date, nullable=False, index=True)
     admissions = Column(Integer, nullable=False, default=0)
     discharges = Column(Integer, nullable=False, default=0)
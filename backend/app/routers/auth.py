@@ -6,6 +6,7 @@ Handles user registration and login.
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from sqlalchemy import exists
 from app.database import get_db
 from app.models.user import User, UserRole
 from app.schemas.auth import UserRegister, UserLogin, Token, UserResponse
@@ -47,8 +48,7 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
         
         # Verify hospital exists
         from app.models.hospital import Hospital
-        hospital = db.query(Hospital).filter(Hospital.id == user_data.hospital_id).first()
-        if not hospital:
+        if not db.query(exists().where(Hospital.id == user_data.hospital_id)).scalar():
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"Hospital with ID {user_data.hospital_id} not found"
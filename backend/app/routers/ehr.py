@@ -9,7 +9,7 @@ Endpoints:
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, exists
 from typing import List
 from datetime import date
 from app.database import get_db
@@ -17,6 +17,7 @@ from app.models.hospital import Hospital, EHRRecord
 from app.models.user import User
 from app.schemas.hospital import EHRRecordCreate, EHRRecordResponse
 from app.services.auth_service import require_hospital_admin
+from app.services.prediction_service import prediction_service
 
 router = APIRouter()
 
@@ -42,8 +43,10 @@ async def create_ehr_record(
         404: Hospital not found
         400: Validation errors
     """
-    # Check if hospital exists
-    hospital = db.query(Hospital).filter(Hospital.id == ehr.hospital_id).first()
+    # Check if hospital exists (only the capacity columns are validated)
+    hospital = db.query(Hospital.total_beds, Hospital.icu_beds).filter(
+        Hospital.id == ehr.hospital_id
+    ).first()
     if not hospital:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -82,6 +85,9 @@ async def create_ehr_record(
     db.commit()
     db.refresh(db_ehr)
     
+    # New history invalidates any cached forecast for this hospital
+    prediction_service.invalidate_hospital(ehr.hospital_id)
+    
     return db_ehr
 
 
@@ -140,8 +146,7 @@ async def get_ehr_records(
         404: Hospital not found
     """
     # Check if hospital exists
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
+    if not db.query(exists().where(Hospital.id == hospital_id)).scalar():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hospital with ID {hospital_id} not found"
@@ -176,8 +181,7 @@ async def get_latest_ehr_record(
         404: Hospital or records not found
     """
     # Check if hospital exists
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
+    if not db.query(exists().where(Hospital.id == hospital_id)).scalar():
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Hospital with ID {hospital_id} not found"
@@ -5,12 +5,14 @@ Endpoints:
 - POST /api/hospitals - Create a new hospital (Admin only)
 - GET /api/hospitals - List all hospitals (Public - no auth required)
 - GET /api/hospitals/{hospital_id} - Get specific hospital details (Public - no auth required)
+- PATCH /api/hospitals - Bulk update hospital names and locations (Admin only)
 - PUT /api/hospitals/{hospital_id}/api-config - Configure API integration (Admin only)
 - POST /api/hospitals/{hospital_id}/sync - Manually trigger API sync (Admin only)
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
 from sqlalchemy.orm import Session
+from sqlalchemy import update, case
 from typing import List
 from datetime import datetime
 import httpx
@@ -21,9 +23,13 @@ from app.schemas.hospital import (
     HospitalCreate, 
     HospitalResponse, 
     APIIntegrationConfig,
-    APISyncResponse
+    APISyncResponse,
+    HospitalBulkUpdateItem,
+    HospitalBulkUpdateResponse
 )
 from app.services.auth_service import require_hospital_admin
+from app.services.prediction_service import prediction_service
+from app.services.hospital_service import invalidate_comparisons
 
 router = APIRouter()
 
@@ -57,6 +63,7 @@ async def create_hospital(
     db.add(db_hospital)
     db.commit()
     db.refresh(db_hospital)
+    invalidate_comparisons()
     
     return db_hospital
 
@@ -82,6 +89,50 @@ async def get_hospitals(
     return hospitals
 
 
+@router.patch("/hospitals", response_model=HospitalBulkUpdateResponse)
+async def bulk_update_hospitals(
+    updates: List[HospitalBulkUpdateItem],
+    db: Session = Depends(get_db),
+    current_user: User = Depends(require_hospital_admin)
+):
+    """
+    Update names and locations of several hospitals at once (Admin only)
+    
+    Args:
+        updates: Hospital ID with its new name and location, per hospital
+        db: Database session
+        current_user: Authenticated hospital admin
+        
+    Returns:
+        Number of hospitals updated and any IDs that do not exist
+    """
+    # Last entry wins if an ID is repeated
+    by_id = {item.id: item for item in updates}
+    if not by_id:
+        return HospitalBulkUpdateResponse(updated=0)
+    
+    existing_ids = {
+        row.id for row in db.query(Hospital.id).filter(Hospital.id.in_(list(by_id))).all()
+    }
+    missing_ids = sorted(set(by_id) - existing_ids)
+    if not existing_ids:
+        return HospitalBulkUpdateResponse(updated=0, missing_ids=missing_ids)
+    
+    # One UPDATE for every hospital, choosing each row's values by ID
+    name_case = case({hid: item.hospital_name for hid, item in by_id.items()}, value=Hospital.id)
+    location_case = case({hid: item.location for hid, item in by_id.items()}, value=Hospital.id)
+    result = db.execute(
+        update(Hospital)
+        .where(Hospital.id.in_(list(existing_ids)))
+        .values(hospital_name=name_case, location=location_case)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    invalidate_comparisons()
+    
+    return HospitalBulkUpdateResponse(updated=result.rowcount, missing_ids=missing_ids)
+
+
 @router.get("/hospitals/{hospital_id}", response_model=HospitalResponse)
 async def get_hospital(
     hospital_id: int,
@@ -157,6 +208,7 @@ async def update_hospital(
     
     db.commit()
     db.refresh(hospital)
+    invalidate_comparisons()
     
     return hospital
 
@@ -283,6 +335,9 @@ async def sync_hospital_data(
             hospital.last_sync = datetime.utcnow()
             db.commit()
             
+            # Synced record changes the history used for forecasting
+            prediction_service.invalidate_hospital(hospital_id)
+            
             return APISyncResponse(
                 success=True,
                 message="Data synced successfully",
@@ -8,11 +8,11 @@ Endpoints:
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
 from typing import List
 from datetime import date, timedelta
+import numpy as np
 from app.database import get_db
-from app.models.hospital import Hospital, EHRRecord
+from app.models.hospital import EHRRecord
 from app.models.user import User
 from app.schemas.hospital import (
     PredictionResponse,
@@ -22,17 +22,12 @@ from app.schemas.hospital import (
 )
 from app.services.prediction_service import prediction_service
 from app.services.auth_service import require_hospital_admin
+from app.services.hospital_service import get_hospital_or_404
 
 router = APIRouter()
 
 
-def _clamp_occupancy(value: float, total_beds: int) -> float:
-    if total_beds <= 0:
-        return max(0.0, float(value or 0))
-    return max(0.0, min(float(value or 0), float(total_beds)))
-
-
-def _build_fallback_predictions(ehr_records: List[EHRRecord], total_beds: int, days: int) -> List[dict]:
+def _build_fallback_predictions(ehr_records: List, total_beds: int, days: int) -> List[dict]:
     """
     Fallback predictor used when Prophet can't train (for example <14 records).
     Uses recent trend with conservative confidence bounds.
@@ -40,28 +35,30 @@ def _build_fallback_predictions(ehr_records: List[EHRRecord], total_beds: int, d
     if not ehr_records:
         return []
 
-    normalized = [_clamp_occupancy(record.occupied_beds, total_beds) for record in ehr_records]
-    recent = normalized[-8:]
-    deltas = [recent[i] - recent[i - 1] for i in range(1, len(recent))]
-    avg_delta = (sum(deltas) / len(deltas)) if deltas else 0.0
-    avg_delta = max(-5.0, min(5.0, avg_delta))
-
-    last_day = ehr_records[-1].date
-    last_occupancy = normalized[-1]
-    predictions = []
+    # Only the last 8 points drive the trend; clamp them to bed capacity
+    capacity = float(total_beds) if total_beds > 0 else None
+    recent = np.clip(
+        np.array([record.occupied_beds or 0 for record in ehr_records[-8:]], dtype=np.float64),
+        0.0,
+        capacity
+    )
+    avg_delta = float(np.clip(np.diff(recent).mean(), -5.0, 5.0)) if len(recent) > 1 else 0.0
 
-    for offset in range(1, days + 1):
-        predicted = _clamp_occupancy(last_occupancy + (avg_delta * offset), total_beds)
-        lower = _clamp_occupancy(predicted - 8, total_beds)
-        upper = _clamp_occupancy(predicted + 8, total_beds)
-        predictions.append({
-            "date": last_day + timedelta(days=offset),
-            "predicted_occupancy": round(predicted, 1),
-            "lower_bound": round(lower, 1),
-            "upper_bound": round(upper, 1),
-        })
+    offsets = np.arange(1, days + 1)
+    predicted = np.clip(recent[-1] + avg_delta * offsets, 0.0, capacity)
+    lower = np.clip(predicted - 8, 0.0, capacity)
+    upper = np.clip(predicted + 8, 0.0, capacity)
 
-    return predictions
+    last_day = ehr_records[-1].date
+    return [
+        {
+            "date": last_day + timedelta(days=int(offset)),
+            "predicted_occupancy": round(float(pred), 1),
+            "lower_bound": round(float(low), 1),
+            "upper_bound": round(float(high), 1),
+        }
+        for offset, pred, low, high in zip(offsets, predicted, lower, upper)
+    ]
 
 
 @router.get("/predict/{hospital_id}", response_model=PredictionResponse)
@@ -91,15 +88,10 @@ async def predict_occupancy(
         400: Insufficient historical data
     """
     # Get hospital
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Hospital with ID {hospital_id} not found"
-        )
+    hospital = get_hospital_or_404(db, hospital_id)
     
-    # Get historical EHR records
-    ehr_records = db.query(EHRRecord).filter(
+    # Get historical EHR records (only the columns the forecast needs)
+    ehr_records = db.query(EHRRecord.date, EHRRecord.occupied_beds).filter(
         EHRRecord.hospital_id == hospital_id
     ).order_by(EHRRecord.date).all()
 
@@ -114,7 +106,8 @@ async def predict_occupancy(
         if len(ehr_records) >= 14:
             predictions, model_info = prediction_service.predict_occupancy(
                 ehr_records=ehr_records,
-                days=days
+                days=days,
+                hospital_id=hospital_id
             )
         else:
             predictions = _build_fallback_predictions(ehr_records, hospital.total_beds, days)
@@ -173,35 +166,36 @@ async def get_dashboard(
         400: Insufficient data
     """
     # Get hospital
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Hospital with ID {hospital_id} not found"
-        )
+    hospital = get_hospital_or_404(db, hospital_id)
     
-    # Get latest EHR record for current metrics
-    latest_record = db.query(EHRRecord).filter(
+    # Load the full history once as plain column tuples (no ORM instances);
+    # latest and 30-day windows are sliced from it
+    all_records = db.query(
+        EHRRecord.date,
+        EHRRecord.occupied_beds,
+        EHRRecord.admissions,
+        EHRRecord.discharges,
+        EHRRecord.icu_occupied,
+        EHRRecord.emergency_cases
+    ).filter(
         EHRRecord.hospital_id == hospital_id
-    ).order_by(desc(EHRRecord.date)).first()
+    ).order_by(EHRRecord.date).all()
     
-    if not latest_record:
+    if not all_records:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No EHR records found for hospital {hospital_id}"
         )
     
+    latest_record = all_records[-1]
+    total_beds = hospital.total_beds
+    utilization_factor = 100.0 / total_beds
+    
     # Calculate current utilization
-    current_utilization = (latest_record.occupied_beds / hospital.total_beds) * 100
+    current_utilization = latest_record.occupied_beds * utilization_factor
     
-    # Get historical data (last 30 days)
+    # Format historical data (last 30 days) in a single pass
     thirty_days_ago = date.today() - timedelta(days=30)
-    historical_records = db.query(EHRRecord).filter(
-        EHRRecord.hospital_id == hospital_id,
-        EHRRecord.date >= thirty_days_ago
-    ).order_by(EHRRecord.date).all()
-    
-    # Format historical data
     historical_data = [
         {
             'date': record.date.isoformat(),
@@ -210,9 +204,10 @@ async def get_dashboard(
             'discharges': record.discharges,
             'icu_occupied': record.icu_occupied,
             'emergency_cases': record.emergency_cases,
-            'utilization': (record.occupied_beds / hospital.total_beds) * 100
+            'utilization': record.occupied_beds * utilization_factor
         }
-        for record in historical_records
+        for record in all_records
+        if record.date >= thirty_days_ago
     ]
     
     # Generate predictions (7 days)
@@ -220,18 +215,14 @@ async def get_dashboard(
     alerts = []
     
     try:
-        # Get all records for prediction
-        all_records = db.query(EHRRecord).filter(
-            EHRRecord.hospital_id == hospital_id
-        ).order_by(EHRRecord.date).all()
-        
         if len(all_records) >= 14:
             pred_data, _ = prediction_service.predict_occupancy(
                 ehr_records=all_records,
-                days=7
+                days=7,
+                hospital_id=hospital_id
             )
         else:
-            pred_data = _build_fallback_predictions(all_records, hospital.total_beds, 7)
+            pred_data = _build_fallback_predictions(all_records, total_beds, 7)
 
         # Convert predictions
         predictions = [
@@ -241,7 +232,7 @@ async def get_dashboard(
         # Generate alerts
         alert_data = prediction_service.generate_alerts(
             predictions=pred_data,
-            total_beds=hospital.total_beds,
+            total_beds=total_beds,
             hospital_name=hospital.hospital_name
         )
         alerts = [AlertItem(**alert) for alert in alert_data]
@@ -249,11 +240,11 @@ async def get_dashboard(
     except Exception as e:
         # If prediction fails, use fallback predictor instead of returning empty
         print(f"Prediction error: {str(e)}")
-        fallback_data = _build_fallback_predictions(all_records, hospital.total_beds, 7)
+        fallback_data = _build_fallback_predictions(all_records, total_beds, 7)
         predictions = [PredictionPoint(**pred) for pred in fallback_data]
         fallback_alerts = prediction_service.generate_alerts(
             predictions=fallback_data,
-            total_beds=hospital.total_beds,
+            total_beds=total_beds,
             hospital_name=hospital.hospital_name
         )
         alerts = [AlertItem(**alert) for alert in fallback_alerts]
@@ -283,7 +274,7 @@ async def get_dashboard(
         hospital_id=hospital.id,
         hospital_name=hospital.hospital_name,
         location=hospital.location,
-        total_beds=hospital.total_beds,
+        total_beds=total_beds,
         icu_beds=hospital.icu_beds,
         current_occupied=latest_record.occupied_beds,
         current_icu_occupied=latest_record.icu_occupied,
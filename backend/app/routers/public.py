@@ -6,13 +6,25 @@ No raw EHR data is exposed. Accessible to PATIENT role.
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import desc, func, case, cast, select, true, Numeric
 from typing import List, Optional
 from datetime import date, timedelta
+from itertools import groupby
+import numpy as np
 from app.database import get_db
 from app.models.hospital import Hospital, EHRRecord
-from app.services.prediction_service import PredictionService
+from app.services.hospital_service import (
+    cache_comparisons,
+    comparison_cache_key,
+    get_cached_comparisons,
+    get_hospital_or_404
+)
+from app.services.prediction_service import (
+    HistoryPoint,
+    prediction_service,
+    predict_histories_in_pool
+)
 from app.schemas.public import (
     PublicHospitalInfo,
     HospitalAvailability,
@@ -25,7 +37,15 @@ from app.schemas.public import (
 )
 
 router = APIRouter(prefix="/public", tags=["Public Patient API"])
-prediction_service = PredictionService()
+
+# History rows per hospital fed to public forecasts (~4 months of daily
+# records); enough for Prophet's weekly seasonality and trend without
+# shipping every record ever stored
+PUBLIC_HISTORY_ROWS = 120
+
+# Patient-facing forecasts only show the mean, so skip Prophet's
+# uncertainty sampling (the dominant cost of predict())
+PUBLIC_UNCERTAINTY_SAMPLES = 0
 
 
 def _clamp_occupancy(occupied_beds: int, total_beds: int) -> int:
@@ -41,16 +61,75 @@ def _calculate_utilization(occupied_beds: int, total_beds: int) -> float:
     return round((occupied_beds / total_beds) * 100, 1)
 
 
-def _risk_from_utilization(utilization: float) -> str:
-    if utilization >= 85:
-        return "high"
-    if utilization >= 70:
-        return "medium"
-    return "low"
+# Labels indexed by how many thresholds (70%, 85%) utilization has crossed
+_RISK_LEVELS = ("low", "medium", "high")
+_AVAILABILITY_STATUSES = ("available", "moderate", "high")
+
+
+def _risk_index(utilization):
+    """Branchless 0/1/2 threshold index; works on floats and NumPy arrays."""
+    return (utilization >= 70) * 1 + (utilization >= 85)
+
+
+def _risk_levels(utilization: np.ndarray) -> np.ndarray:
+    return np.take(np.array(_RISK_LEVELS), _risk_index(utilization))
+
+
+def _latest_ehr_lateral():
+    """
+    LATERAL subquery yielding a hospital's latest EHR (date, occupied_beds).
+    Join it with `true()`; each joined hospital costs one ix_ehr_hospital_date
+    seek instead of ranking the whole EHR table.
+    """
+    return select(
+        EHRRecord.date,
+        EHRRecord.occupied_beds
+    ).where(
+        EHRRecord.hospital_id == Hospital.id
+    ).order_by(desc(EHRRecord.date)).limit(1).lateral("latest_ehr")
+
+
+def _recent_ehr_history(db: Session, hospital_ids: List[int], limit: int) -> list:
+    """
+    Fetch the last `limit` (date, occupied_beds) rows for each hospital in one
+    query, ordered by hospital then date.
+    """
+    if not hospital_ids:
+        return []
+
+    # LATERAL top-N per hospital: each one is a bounded ix_ehr_hospital_date
+    # range scan, so the work doesn't grow with the full EHR history
+    recent = select(
+        EHRRecord.date,
+        EHRRecord.occupied_beds
+    ).where(
+        EHRRecord.hospital_id == Hospital.id
+    ).order_by(desc(EHRRecord.date)).limit(limit).lateral("recent_ehr")
+    return db.query(
+        Hospital.id.label("hospital_id"),
+        recent.c.date,
+        recent.c.occupied_beds
+    ).join(
+        recent, true()
+    ).filter(
+        Hospital.id.in_(hospital_ids)
+    ).order_by(Hospital.id, recent.c.date).all()
+
+
+def _hospital_ehr_history(db: Session, hospital_id: int, limit: int) -> list:
+    """
+    Fetch the last `limit` (date, occupied_beds) rows for one hospital,
+    oldest first.
+    """
+    recent = db.query(EHRRecord.date, EHRRecord.occupied_beds).filter(
+        EHRRecord.hospital_id == hospital_id
+    ).order_by(desc(EHRRecord.date)).limit(limit).all()
+    recent.reverse()
+    return recent
 
 
 def _build_fallback_forecast(
-    ehr_records: List[EHRRecord],
+    ehr_records: List,
     total_beds: int,
     days: int
 ) -> List[dict]:
@@ -61,64 +140,77 @@ def _build_fallback_forecast(
     if not ehr_records:
         return []
 
-    normalized = [
-        _clamp_occupancy(record.occupied_beds, total_beds)
-        for record in ehr_records
-    ]
-
     # Use recent deltas to capture direction while keeping projections stable.
-    recent = normalized[-8:]
-    deltas = [recent[i] - recent[i - 1] for i in range(1, len(recent))]
-    avg_delta = (sum(deltas) / len(deltas)) if deltas else 0
-    avg_delta = max(-5.0, min(5.0, avg_delta))
+    capacity = total_beds if total_beds > 0 else None
+    recent = np.clip(
+        np.array([int(record.occupied_beds or 0) for record in ehr_records[-8:]], dtype=np.float64),
+        0,
+        capacity
+    )
+    avg_delta = float(np.clip(np.diff(recent).mean(), -5.0, 5.0)) if len(recent) > 1 else 0.0
+
+    offsets = np.arange(1, days + 1)
+    projected = np.clip(np.rint(recent[-1] + avg_delta * offsets), 0, capacity).astype(int)
 
     last_day = ehr_records[-1].date
-    last_occupancy = normalized[-1]
-    predictions = []
+    return [
+        {
+            "date": last_day + timedelta(days=int(day_offset)),
+            "predicted_occupancy": int(occupancy)
+        }
+        for day_offset, occupancy in zip(offsets, projected)
+    ]
 
-    for day_offset in range(1, days + 1):
-        projected = _clamp_occupancy(
-            round(last_occupancy + (avg_delta * day_offset)),
-            total_beds
-        )
-        predictions.append({
-            "date": last_day + timedelta(days=day_offset),
-            "predicted_occupancy": projected
-        })
 
-    return predictions
+def _occupancy_profile(
+    predictions: List[dict],
+    total_beds: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Clamp predicted occupancy and compute utilization for a whole forecast
+    at once. Returns (occupancy, utilization) arrays aligned with predictions.
+    """
+    capacity = total_beds if total_beds > 0 else None
+    occupancy = np.clip(
+        np.array([pred.get("predicted_occupancy", 0) or 0 for pred in predictions], dtype=np.float64),
+        0,
+        capacity
+    ).astype(int)
+    if total_beds <= 0:
+        return occupancy, np.zeros(len(occupancy))
+    return occupancy, np.round(occupancy / total_beds * 100, 1)
+
+
+def _date_str(value) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
 
 
 def _format_forecast_response(
     predictions: List[dict],
     total_beds: int
 ) -> tuple[List[DayForecast], Optional[str], Optional[int]]:
-    forecast_days: List[DayForecast] = []
-    min_occupancy = float("inf")
-    best_day: Optional[str] = None
-
-    for pred in predictions:
-        predicted_occ = _clamp_occupancy(pred.get("predicted_occupancy", 0), total_beds)
-        available = max(0, total_beds - predicted_occ)
-        utilization = _calculate_utilization(predicted_occ, total_beds)
-        risk = _risk_from_utilization(utilization)
-        pred_date = pred.get("date")
-        date_str = pred_date.isoformat() if hasattr(pred_date, "isoformat") else str(pred_date)
-
-        if predicted_occ < min_occupancy:
-            min_occupancy = predicted_occ
-            best_day = date_str
-
-        forecast_days.append(DayForecast(
+    if not predictions:
+        return [], None, None
+
+    occupancy, utilization = _occupancy_profile(predictions, total_beds)
+    available = np.maximum(0, total_beds - occupancy)
+    risk = _risk_levels(utilization)
+    date_strs = [_date_str(pred.get("date")) for pred in predictions]
+
+    forecast_days = [
+        DayForecast(
             date=date_str,
-            predicted_occupancy=predicted_occ,
-            predicted_available=available,
-            utilization_percentage=utilization,
-            risk_level=risk
-        ))
+            predicted_occupancy=int(occ),
+            predicted_available=int(avail),
+            utilization_percentage=float(util),
+            risk_level=str(level)
+        )
+        for date_str, occ, avail, util, level in zip(date_strs, occupancy, available, utilization, risk)
+    ]
 
-    best_day_occupancy = int(min_occupancy) if min_occupancy != float("inf") else None
-    return forecast_days, best_day, best_day_occupancy
+    # argmin returns the first minimum, matching "earliest least-busy day"
+    best_idx = int(np.argmin(occupancy))
+    return forecast_days, date_strs[best_idx], int(occupancy[best_idx])
 
 
 @router.get("/hospitals", response_model=List[PublicHospitalInfo])
@@ -131,7 +223,14 @@ async def get_public_hospitals(
     
     Accessible without authentication. Returns basic hospital info.
     """
-    query = db.query(Hospital)
+    # Only the public columns; skips API credentials and sync metadata
+    query = db.query(Hospital).options(load_only(
+        Hospital.id,
+        Hospital.hospital_name,
+        Hospital.location,
+        Hospital.total_beds,
+        Hospital.icu_beds
+    ))
     
     if city:
         query = query.filter(Hospital.location.ilike(f"%{city}%"))
@@ -157,54 +256,59 @@ async def get_hospital_availability(
     
     Shows real-time occupancy status without exposing sensitive EHR data.
     """
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
+    # Hospital info and its latest EHR record in one round-trip; the outer
+    # join still yields a row (with NULL EHR columns) when no records exist
+    hospital = db.query(
+        Hospital.id,
+        Hospital.hospital_name,
+        Hospital.location,
+        Hospital.total_beds,
+        EHRRecord.date,
+        EHRRecord.occupied_beds
+    ).outerjoin(
+        EHRRecord, EHRRecord.hospital_id == Hospital.id
+    ).filter(
+        Hospital.id == hospital_id
+    ).order_by(desc(EHRRecord.date)).first()
+    
+    if hospital is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Hospital not found"
+            detail=f"Hospital with ID {hospital_id} not found"
         )
+    total_beds = hospital.total_beds
     
-    # Get latest EHR record for current occupancy
-    latest_record = db.query(EHRRecord).filter(
-        EHRRecord.hospital_id == hospital_id
-    ).order_by(desc(EHRRecord.date)).first()
-    
-    if not latest_record:
+    if hospital.date is None:
         # Return a response indicating no data instead of 404
         return HospitalAvailability(
             hospital_id=hospital.id,
             hospital_name=hospital.hospital_name,
             location=hospital.location,
-            total_beds=hospital.total_beds,
+            total_beds=total_beds,
             current_occupied=0,
-            current_available=hospital.total_beds,
+            current_available=total_beds,
             utilization_percentage=0.0,
             status="unknown",
             last_updated=None
         )
     
-    current_occupied = _clamp_occupancy(latest_record.occupied_beds, hospital.total_beds)
-    current_available = max(0, hospital.total_beds - current_occupied)
-    utilization = _calculate_utilization(current_occupied, hospital.total_beds)
+    current_occupied = _clamp_occupancy(hospital.occupied_beds, total_beds)
+    current_available = max(0, total_beds - current_occupied)
+    utilization = _calculate_utilization(current_occupied, total_beds)
 
     # Determine status
-    if utilization >= 85:
-        status_str = "high"
-    elif utilization >= 70:
-        status_str = "moderate"
-    else:
-        status_str = "available"
+    status_str = _AVAILABILITY_STATUSES[_risk_index(utilization)]
     
     return HospitalAvailability(
         hospital_id=hospital.id,
         hospital_name=hospital.hospital_name,
         location=hospital.location,
-        total_beds=hospital.total_beds,
+        total_beds=total_beds,
         current_occupied=current_occupied,
         current_available=current_available,
         utilization_percentage=utilization,
         status=status_str,
-        last_updated=latest_record.date.isoformat()
+        last_updated=hospital.date.isoformat()
     )
 
 
@@ -220,24 +324,18 @@ async def get_hospital_forecast(
     Uses ML prediction to show expected bed availability.
     Helps patients plan their visit timing.
     """
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Hospital not found"
-        )
+    hospital = get_hospital_or_404(db, hospital_id)
+    total_beds = hospital.total_beds
     
-    # Get all EHR records for prediction
-    ehr_records = db.query(EHRRecord).filter(
-        EHRRecord.hospital_id == hospital_id
-    ).order_by(EHRRecord.date).all()
+    # Get recent EHR records for prediction
+    ehr_records = _hospital_ehr_history(db, hospital_id, PUBLIC_HISTORY_ROWS)
     
     if len(ehr_records) == 0:
         return HospitalForecast(
             hospital_id=hospital.id,
             hospital_name=hospital.hospital_name,
             location=hospital.location,
-            total_beds=hospital.total_beds,
+            total_beds=total_beds,
             forecast=[],
             best_day_to_visit=None,
             best_day_occupancy=None
@@ -248,40 +346,68 @@ async def get_hospital_forecast(
         try:
             predictions, _ = prediction_service.predict_occupancy(
                 ehr_records=ehr_records,
-                days=days
+                days=days,
+                hospital_id=hospital_id,
+                uncertainty_samples=PUBLIC_UNCERTAINTY_SAMPLES
             )
         except Exception:
-            predictions = _build_fallback_forecast(ehr_records, hospital.total_beds, days)
+            predictions = _build_fallback_forecast(ehr_records, total_beds, days)
     else:
-        predictions = _build_fallback_forecast(ehr_records, hospital.total_beds, days)
+        predictions = _build_fallback_forecast(ehr_records, total_beds, days)
 
     forecast_days, best_day, best_day_occupancy = _format_forecast_response(
         predictions=predictions,
-        total_beds=hospital.total_beds
+        total_beds=total_beds
     )
     
     return HospitalForecast(
         hospital_id=hospital.id,
         hospital_name=hospital.hospital_name,
         location=hospital.location,
-        total_beds=hospital.total_beds,
+        total_beds=total_beds,
         forecast=forecast_days,
         best_day_to_visit=best_day,
         best_day_occupancy=best_day_occupancy
     )
 
 
-@router.get("/compare", response_model=List[HospitalComparison])
-async def compare_hospitals(
-    city: Optional[str] = Query(None, description="Filter by city"),
-    db: Session = Depends(get_db)
-):
+async def _compute_city_comparisons(
+    city: Optional[str],
+    db: Session
+) -> List[HospitalComparison]:
     """
-    Compare hospitals by current and predicted availability
-    
-    Ranks hospitals to help patients choose the best option.
+    Rank hospitals (optionally filtered by city) by current and predicted
+    availability. Shared by /compare and /recommendation.
     """
-    query = db.query(Hospital)
+    # Current metrics for every hospital in one SELECT (outer joins keep
+    # hospitals without any EHR data so the 404 check still sees them).
+    # Occupancy clamping, utilization and risk are computed by the database.
+    latest = _latest_ehr_lateral()
+    current_occupancy = case(
+        (latest.c.occupied_beds > Hospital.total_beds, Hospital.total_beds),
+        (latest.c.occupied_beds < 0, 0),
+        else_=latest.c.occupied_beds
+    )
+    utilization = func.coalesce(
+        func.round(
+            cast(current_occupancy * 100, Numeric) / func.nullif(Hospital.total_beds, 0),
+            1
+        ),
+        0
+    )
+    query = db.query(
+        Hospital.id,
+        Hospital.hospital_name,
+        Hospital.location,
+        Hospital.total_beds,
+        current_occupancy.label("current_occupancy"),
+        utilization.label("utilization"),
+        case(
+            (utilization >= 85, "high"),
+            (utilization >= 70, "medium"),
+            else_="low"
+        ).label("risk_level")
+    ).outerjoin(latest, true())
     
     if city:
         query = query.filter(Hospital.location.ilike(f"%{city}%"))
@@ -294,69 +420,86 @@ async def compare_hospitals(
             detail="No hospitals found"
         )
     
-    comparisons = []
+    # Only the most recent rows per hospital are needed to feed the forecast
+    hospital_ids = [hospital.id for hospital in hospitals if hospital.current_occupancy is not None]
+    records_by_hospital = {
+        hospital_id: list(records)
+        for hospital_id, records in groupby(
+            _recent_ehr_history(db, hospital_ids, PUBLIC_HISTORY_ROWS),
+            key=lambda record: record.hospital_id
+        )
+    }
     
-    for hospital in hospitals:
-        # Get current occupancy
-        latest_record = db.query(EHRRecord).filter(
-            EHRRecord.hospital_id == hospital.id
-        ).order_by(desc(EHRRecord.date)).first()
-        
-        if not latest_record:
+    # Serve cached forecasts directly and train the rest in parallel processes
+    forecasts = {}
+    pending = {}
+    for hospital_id, ehr_records in records_by_hospital.items():
+        if len(ehr_records) < 14:
             continue
-        
-        current_occ = _clamp_occupancy(latest_record.occupied_beds, hospital.total_beds)
-        current_avail = max(0, hospital.total_beds - current_occ)
-        utilization = _calculate_utilization(current_occ, hospital.total_beds)
-        
-        # Get 7-day prediction average
-        ehr_records = db.query(EHRRecord).filter(
-            EHRRecord.hospital_id == hospital.id
-        ).order_by(EHRRecord.date).all()
-        
-        avg_predicted = current_occ  # Default to current if prediction fails
-
-        if len(ehr_records) >= 14:
-            try:
-                predictions, _ = prediction_service.predict_occupancy(
-                    ehr_records=ehr_records,
-                    days=7
-                )
-                avg_predicted = sum(p['predicted_occupancy'] for p in predictions) / len(predictions)
-            except Exception:
-                fallback = _build_fallback_forecast(ehr_records, hospital.total_beds, 7)
-                if fallback:
-                    avg_predicted = sum(p['predicted_occupancy'] for p in fallback) / len(fallback)
-        else:
-            fallback = _build_fallback_forecast(ehr_records, hospital.total_beds, 7)
-            if fallback:
-                avg_predicted = sum(p['predicted_occupancy'] for p in fallback) / len(fallback)
-        
-        # Calculate recommendation score (0-100, higher is better)
-        # Lower occupancy = higher score
-        availability_score = ((hospital.total_beds - current_occ) / hospital.total_beds) * 50
-        future_availability_score = ((hospital.total_beds - avg_predicted) / hospital.total_beds) * 50
-        recommendation_score = availability_score + future_availability_score
-        
-        # Determine risk level
-        if utilization >= 85:
-            risk = "high"
-        elif utilization >= 70:
-            risk = "medium"
+        cache_key = prediction_service.cache_key(
+            hospital_id, ehr_records, 7, PUBLIC_UNCERTAINTY_SAMPLES
+        )
+        cached = prediction_service.get_cached_prediction(cache_key)
+        if cached is not None:
+            forecasts[hospital_id] = cached[0]
         else:
-            risk = "low"
-        
-        comparisons.append(HospitalComparison(
+            pending[hospital_id] = cache_key
+    
+    if pending:
+        results = await predict_histories_in_pool(
+            [
+                [HistoryPoint(r.date, r.occupied_beds) for r in records_by_hospital[hospital_id]]
+                for hospital_id in pending
+            ],
+            7,
+            PUBLIC_UNCERTAINTY_SAMPLES
+        )
+        for (hospital_id, cache_key), result in zip(pending.items(), results):
+            if isinstance(result, BaseException):
+                continue
+            prediction_service.cache_prediction(cache_key, result)
+            forecasts[hospital_id] = result[0]
+    
+    ranked = [hospital for hospital in hospitals if records_by_hospital.get(hospital.id)]
+    if not ranked:
+        return []
+    
+    # Stack 7-day forecasts (Prophet when available, otherwise trend fallback)
+    # into an (H, 7) matrix and score every hospital in one vectorized pass
+    forecast_matrix = np.array([
+        [
+            p['predicted_occupancy']
+            for p in (
+                forecasts.get(hospital.id)
+                or _build_fallback_forecast(records_by_hospital[hospital.id], hospital.total_beds, 7)
+            )
+        ]
+        for hospital in ranked
+    ], dtype=np.float64)
+    total_beds = np.array([hospital.total_beds for hospital in ranked], dtype=np.float64)
+    current_occ = np.array([hospital.current_occupancy for hospital in ranked], dtype=np.float64)
+    avg_predicted = forecast_matrix.mean(axis=1)
+    
+    # Calculate recommendation score (0-100, higher is better)
+    # Lower occupancy = higher score
+    availability_score = ((total_beds - current_occ) / total_beds) * 50
+    future_availability_score = ((total_beds - avg_predicted) / total_beds) * 50
+    recommendation_scores = availability_score + future_availability_score
+    
+    comparisons = [
+        HospitalComparison(
             hospital_id=hospital.id,
             hospital_name=hospital.hospital_name,
             location=hospital.location,
-            current_occupancy=current_occ,
-            current_available=current_avail,
-            utilization_percentage=utilization,
-            avg_predicted_occupancy_7_days=round(avg_predicted, 1),
-            recommendation_score=round(recommendation_score, 1),
-            risk_level=risk
-        ))
+            current_occupancy=hospital.current_occupancy,
+            current_available=max(0, hospital.total_beds - hospital.current_occupancy),
+            utilization_percentage=float(hospital.utilization),
+            avg_predicted_occupancy_7_days=round(float(avg), 1),
+            recommendation_score=round(float(score), 1),
+            risk_level=hospital.risk_level
+        )
+        for hospital, avg, score in zip(ranked, avg_predicted, recommendation_scores)
+    ]
     
     # Sort by recommendation score (highest first)
     comparisons.sort(key=lambda x: x.recommendation_score, reverse=True)
@@ -364,6 +507,38 @@ async def compare_hospitals(
     return comparisons
 
 
+async def _cached_city_comparisons(
+    city: Optional[str],
+    db: Session
+) -> List[HospitalComparison]:
+    """
+    Memoized _compute_city_comparisons. See hospital_service for what the
+    cache key covers and how stale entries can get.
+    """
+    latest_date = db.query(func.max(EHRRecord.date)).scalar()
+    cache_key = comparison_cache_key(city, latest_date, prediction_service.data_generation)
+    
+    comparisons = get_cached_comparisons(cache_key)
+    if comparisons is None:
+        comparisons = await _compute_city_comparisons(city, db)
+        cache_comparisons(cache_key, comparisons)
+    
+    return comparisons
+
+
+@router.get("/compare", response_model=List[HospitalComparison])
+async def compare_hospitals(
+    city: Optional[str] = Query(None, description="Filter by city"),
+    db: Session = Depends(get_db)
+):
+    """
+    Compare hospitals by current and predicted availability
+    
+    Ranks hospitals to help patients choose the best option.
+    """
+    return await _cached_city_comparisons(city, db)
+
+
 @router.get("/recommendation/{city}", response_model=CityRecommendation)
 async def get_city_recommendation(
     city: str,
@@ -375,7 +550,7 @@ async def get_city_recommendation(
     Analyzes all hospitals in a city and recommends the best option
     based on current and predicted availability.
     """
-    comparisons = await compare_hospitals(city=city, db=db)
+    comparisons = await _cached_city_comparisons(city, db)
     
     if not comparisons:
         raise HTTPException(
@@ -413,85 +588,86 @@ async def get_hospital_alerts(
     Warns patients if hospital is expected to be crowded.
     Suggests alternatives if needed based on risk levels.
     """
-    hospital = db.query(Hospital).filter(Hospital.id == hospital_id).first()
-    if not hospital:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Hospital not found"
-        )
+    hospital = get_hospital_or_404(db, hospital_id)
+    total_beds = hospital.total_beds
     
     alerts = []
     has_high_risk = False
     
     # Get predictions
-    ehr_records = db.query(EHRRecord).filter(
-        EHRRecord.hospital_id == hospital_id
-    ).order_by(EHRRecord.date).all()
+    ehr_records = _hospital_ehr_history(db, hospital_id, PUBLIC_HISTORY_ROWS)
     
     predictions = []
     if len(ehr_records) >= 14:
         try:
             predictions, _ = prediction_service.predict_occupancy(
                 ehr_records=ehr_records,
-                days=7
+                days=7,
+                hospital_id=hospital_id,
+                uncertainty_samples=PUBLIC_UNCERTAINTY_SAMPLES
             )
         except Exception:
-            predictions = _build_fallback_forecast(ehr_records, hospital.total_beds, 7)
+            predictions = _build_fallback_forecast(ehr_records, total_beds, 7)
     else:
-        predictions = _build_fallback_forecast(ehr_records, hospital.total_beds, 7)
+        predictions = _build_fallback_forecast(ehr_records, total_beds, 7)
 
     # Check for high occupancy days
-    for pred in predictions:
-        predicted_occ = _clamp_occupancy(pred['predicted_occupancy'], hospital.total_beds)
-        utilization = _calculate_utilization(predicted_occ, hospital.total_beds)
-        date_str = pred['date'].isoformat() if hasattr(pred['date'], 'isoformat') else str(pred['date'])
+    if predictions:
+        _, utilization = _occupancy_profile(predictions, total_beds)
+        high_mask = utilization >= 85
+        warning_mask = (utilization >= 70) & ~high_mask
+        has_high_risk = bool(high_mask.any())
 
         # Create alerts for medium and high risk levels
-        if utilization >= 85:
-            has_high_risk = True
-            alerts.append(AvailabilityAlert(
-                alert_type="high_occupancy",
-                message=f"Critical occupancy expected on {date_str} ({utilization:.0f}%). Long wait times likely. Consider visiting an alternate hospital or a different day.",
-                severity="critical",
-                date=date_str
-            ))
-        elif utilization >= 70:
-            alerts.append(AvailabilityAlert(
-                alert_type="capacity_warning",
-                message=f"Moderate occupancy expected on {date_str} ({utilization:.0f}%). May experience longer wait times.",
-                severity="warning",
-                date=date_str
-            ))
+        for idx in np.flatnonzero(high_mask | warning_mask):
+            date_str = _date_str(predictions[idx]['date'])
+            util = utilization[idx]
+            if high_mask[idx]:
+                alerts.append(AvailabilityAlert(
+                    alert_type="high_occupancy",
+                    message=f"Critical occupancy expected on {date_str} ({util:.0f}%). Long wait times likely. Consider visiting an alternate hospital or a different day.",
+                    severity="critical",
+                    date=date_str
+                ))
+            else:
+                alerts.append(AvailabilityAlert(
+                    alert_type="capacity_warning",
+                    message=f"Moderate occupancy expected on {date_str} ({util:.0f}%). May experience longer wait times.",
+                    severity="warning",
+                    date=date_str
+                ))
     
     # Get alternate hospitals if there are high risk alerts
     alternate_hospitals = []
     if has_high_risk or len(alerts) >= 3:
-        # Find hospitals in same location with better availability
-        other_hospitals = db.query(Hospital).filter(
-            Hospital.location.ilike(f"%{hospital.location.split(',')[0]}%"),
-            Hospital.id != hospital_id
-        ).all()
+        # Find hospitals in same location with better availability (< 70%),
+        # joined to their latest EHR record in a single query
+        city_prefix = hospital.location.split(',')[0]
+        latest = _latest_ehr_lateral()
+        candidates = db.query(
+            Hospital.id,
+            Hospital.hospital_name,
+            Hospital.location,
+            Hospital.total_beds,
+            Hospital.icu_beds
+        ).join(
+            latest, true()
+        ).filter(
+            Hospital.location.ilike(f"%{city_prefix}%"),
+            Hospital.id != hospital_id,
+            latest.c.occupied_beds * 100 < Hospital.total_beds * 70
+        ).limit(3).all()
         
-        # Get current availability for alternates
-        for alt_hospital in other_hospitals[:5]:  # Check up to 5 hospitals
-            latest_record = db.query(EHRRecord).filter(
-                EHRRecord.hospital_id == alt_hospital.id
-            ).order_by(desc(EHRRecord.date)).first()
-            
-            if latest_record:
-                alt_occupied = _clamp_occupancy(latest_record.occupied_beds, alt_hospital.total_beds)
-                alt_utilization = _calculate_utilization(alt_occupied, alt_hospital.total_beds)
-                # Only recommend hospitals with better availability (< 70%)
-                if alt_utilization < 70:
-                    alternate_hospitals.append(PublicHospitalInfo(
-                        id=alt_hospital.id,
-                        hospital_name=alt_hospital.hospital_name,
-                        location=alt_hospital.location,
-                        total_beds=alt_hospital.total_beds,
-                        icu_beds=alt_hospital.icu_beds
-                    ))
-                    if len(alternate_hospitals) >= 3:
-                        break
+        alternate_hospitals = [
+            PublicHospitalInfo(
+                id=alt.id,
+                hospital_name=alt.hospital_name,
+                location=alt.location,
+                total_beds=alt.total_beds,
+                icu_beds=alt.icu_beds
+            )
+            for alt in candidates
+        ]
     
     return AlertsResponse(
         hospital_id=hospital.id,
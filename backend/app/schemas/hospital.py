@@ -65,6 +65,19 @@ class APISyncResponse(BaseModel):
     last_sync: Optional[datetime_type] = None
 
 
+class HospitalBulkUpdateItem(BaseModel):
+    """Schema for one hospital in a bulk name/location update"""
+    id: int = Field(..., description="Hospital ID to update")
+    hospital_name: str = Field(..., min_length=1, max_length=200, description="Name of the hospital")
+    location: str = Field(..., min_length=1, max_length=200, description="Hospital location/address")
+
+
+class HospitalBulkUpdateResponse(BaseModel):
+    """Schema for bulk hospital update response"""
+    updated: int
+    missing_ids: List[int] = []
+
+
 # ============== EHR Record Schemas ==============
 
 class EHRRecordBase(BaseModel):
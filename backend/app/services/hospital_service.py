@@ -0,0 +1,74 @@
+"""
+Hospital Lookup Helpers
+
+Shared by routers that only need a hospital's basic columns, plus the cache
+of ranked city comparisons built from those columns.
+"""
+
+from cachetools import TTLCache
+from datetime import date
+from typing import List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy.orm import Session
+from app.models.hospital import Hospital
+
+
+def get_hospital_or_404(db: Session, hospital_id: int):
+    """
+    Fetch the hospital's public columns (id, name, location, bed counts)
+    as a lightweight row instead of a full ORM object.
+    Raises 404 if the hospital does not exist.
+    """
+    hospital = db.query(
+        Hospital.id,
+        Hospital.hospital_name,
+        Hospital.location,
+        Hospital.total_beds,
+        Hospital.icu_beds
+    ).filter(Hospital.id == hospital_id).first()
+    if hospital is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Hospital with ID {hospital_id} not found"
+        )
+    return hospital
+
+
+# Ranked /compare results per city, shared with /recommendation.
+# Writes made through this API invalidate entries immediately (EHR writes via
+# the prediction service's data generation, hospital writes via
+# invalidate_comparisons). Writes made outside the API, such as
+# generate_data.py, add_ehr_data.py or update_hospitals_db.py, only show up
+# early if they raise the newest EHR date; otherwise they appear once the
+# TTL expires, so keep it short.
+COMPARISON_CACHE_TTL_SECONDS = 5 * 60
+_comparison_cache: TTLCache = TTLCache(maxsize=256, ttl=COMPARISON_CACHE_TTL_SECONDS)
+# Bumped on every hospital create/update made through the API
+_hospitals_version = 0
+
+
+def comparison_cache_key(
+    city: Optional[str],
+    latest_ehr_date: Optional[date],
+    data_generation: int
+) -> tuple:
+    """Build the comparison cache key for a city and the current data state"""
+    return ((city or "").lower(), latest_ehr_date, data_generation, _hospitals_version)
+
+
+def get_cached_comparisons(key: tuple) -> Optional[List]:
+    """Return a copy of the cached comparisons for a key, or None on a miss"""
+    comparisons = _comparison_cache.get(key)
+    return None if comparisons is None else list(comparisons)
+
+
+def cache_comparisons(key: tuple, comparisons: List) -> None:
+    """Store ranked comparisons for a key"""
+    _comparison_cache[key] = list(comparisons)
+
+
+def invalidate_comparisons() -> None:
+    """Invalidate cached comparisons after any hospital write"""
+    global _hospitals_version
+    _hospitals_version += 1
+    _comparison_cache.clear()
@@ -18,16 +18,49 @@ Prophet Model Components:
 - Holidays: Can be extended to include holidays (future enhancement)
 """
 
+import asyncio
 import pandas as pd
 import numpy as np
 from prophet import Prophet
-from datetime import datetime, timedelta
-from typing import List, Dict, Tuple
+from cachetools import TTLCache
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timedelta
+from typing import List, Dict, Tuple, Optional, NamedTuple
+import multiprocessing
+import os
+import threading
 import warnings
 
 # Suppress Prophet's verbose output
 warnings.filterwarnings('ignore')
 
+# Maximum number of memoized prediction results kept per process
+PREDICTION_CACHE_SIZE = 512
+
+# Fitted Prophet models kept warm per process, refit at least daily
+MODEL_CACHE_SIZE = 512
+MODEL_CACHE_TTL_SECONDS = 24 * 3600
+
+# Prophet worker processes for multi-hospital requests. Each worker holds its
+# own Prophet/Stan runtime, so keep the count bounded regardless of host size.
+PREDICTION_POOL_MAX_WORKERS = int(
+    os.getenv("PREDICTION_POOL_MAX_WORKERS", str(min(4, os.cpu_count() or 1)))
+)
+
+# Never fork workers straight from the server: it is multi-threaded and holds
+# pooled DB connections the children must not inherit
+PREDICTION_POOL_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
+class HistoryPoint(NamedTuple):
+    """Picklable (date, occupied_beds) pair for shipping history to worker processes"""
+    date: date
+    occupied_beds: int
+
 
 class PredictionService:
     """
@@ -38,6 +71,19 @@ class PredictionService:
         """Initialize prediction service"""
         self.model = None
         self.trained = False
+        
+        # Memoized (predictions, model_info) keyed by hospital data snapshot
+        self._prediction_cache: "OrderedDict[tuple, Tuple[List[Dict], Dict]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Per-hospital counter bumped on every EHR write to invalidate the cache
+        self._data_versions: Dict[int, int] = {}
+        # Global counter bumped on any EHR write, for caches spanning hospitals
+        self._data_generation = 0
+        
+        # Fitted models shared across horizons, with one fit lock per key so
+        # concurrent requests for the same hospital don't train twice
+        self._model_cache: TTLCache = TTLCache(maxsize=MODEL_CACHE_SIZE, ttl=MODEL_CACHE_TTL_SECONDS)
+        self._model_locks: Dict[tuple, threading.Lock] = {}
     
     def prepare_data(self, ehr_records: List) -> pd.DataFrame:
         """
@@ -67,36 +113,49 @@ class PredictionService:
         
         return data
     
-    def train_model(self, historical_data: pd.DataFrame) -> Dict:
+    def train_model(self, historical_data: pd.DataFrame, uncertainty_samples: int = 1000) -> Dict:
         """
         Train Prophet model on historical bed occupancy data
         
         Args:
             historical_data: DataFrame with 'ds' and 'y' columns
+            uncertainty_samples: Simulations used for confidence bounds
+                (0 skips interval estimation for mean-only forecasts)
             
         Returns:
             Dictionary with training metadata
         """
+        self.model, model_info = self._fit_model(historical_data, uncertainty_samples)
+        self.trained = True
+        return model_info
+    
+    def _fit_model(
+        self,
+        historical_data: pd.DataFrame,
+        uncertainty_samples: int = 1000
+    ) -> Tuple[Prophet, Dict]:
+        """Create and fit a Prophet model, returning it with training metadata"""
         # Initialize Prophet model
         # Parameters explained:
         # - daily_seasonality: Capture daily patterns (not needed for daily aggregated data)
         # - weekly_seasonality: Capture weekly patterns (e.g., weekend effects)
         # - yearly_seasonality: Capture seasonal patterns (if enough data)
         # - changepoint_prior_scale: Control trend flexibility (0.05 is conservative)
-        self.model = Prophet(
+        # - uncertainty_samples: Dominates predict() time; 0 disables bounds
+        model = Prophet(
             daily_seasonality=False,
             weekly_seasonality=True,
             yearly_seasonality='auto',
             changepoint_prior_scale=0.05,
-            interval_width=0.95  # 95% confidence interval
+            interval_width=0.95,  # 95% confidence interval
+            uncertainty_samples=uncertainty_samples
         )
         
         # Train the model
-        self.model.fit(historical_data)
-        self.trained = True
+        model.fit(historical_data)
         
-        # Return training metadata
-        return {
+        # Return model with training metadata
+        return model, {
             'model': 'Prophet',
             'training_samples': len(historical_data),
             'date_range': {
@@ -119,26 +178,146 @@ class PredictionService:
         if not self.trained or self.model is None:
             raise ValueError("Model must be trained before making predictions")
         
+        return self._forecast(self.model, days)
+    
+    def _forecast(self, model: Prophet, days: int) -> pd.DataFrame:
+        """Predict the next `days` days with a fitted model"""
         # Create future dataframe
-        future = self.model.make_future_dataframe(periods=days)
+        future = model.make_future_dataframe(periods=days)
         
         # Generate predictions
-        forecast = self.model.predict(future)
+        forecast = model.predict(future)
         
         # Return only future predictions
         return forecast.tail(days)
     
+    def get_or_fit_model(
+        self,
+        hospital_id: int,
+        ehr_records: List,
+        uncertainty_samples: int = 1000
+    ) -> Tuple[Prophet, Dict]:
+        """
+        Return a fitted Prophet model for a hospital's current history
+        
+        Models are cached per hospital data snapshot, so forecasts for
+        different horizons reuse one fit. Concurrent callers for the same
+        snapshot wait on a shared lock instead of training in parallel.
+        
+        Args:
+            hospital_id: Hospital the records belong to
+            ehr_records: Historical EHR records ordered by date
+            uncertainty_samples: Prophet uncertainty simulations
+            
+        Returns:
+            Tuple of (fitted model, training metadata)
+        """
+        with self._cache_lock:
+            key = (
+                hospital_id,
+                self._data_versions.get(hospital_id, 0),
+                ehr_records[-1].date,
+                len(ehr_records),
+                uncertainty_samples
+            )
+            cached = self._model_cache.get(key)
+            if cached is not None:
+                return cached
+            fit_lock = self._model_locks.setdefault(key, threading.Lock())
+        
+        with fit_lock:
+            with self._cache_lock:
+                cached = self._model_cache.get(key)
+            if cached is not None:
+                return cached
+            
+            try:
+                fitted = self._fit_model(self.prepare_data(ehr_records), uncertainty_samples)
+                with self._cache_lock:
+                    self._model_cache[key] = fitted
+            finally:
+                # Drop the fit lock even when training fails so it can't leak,
+                # but only if it is still ours; a later caller may have
+                # registered a new lock for the same key
+                with self._cache_lock:
+                    if self._model_locks.get(key) is fit_lock:
+                        del self._model_locks[key]
+            return fitted
+    
+    def invalidate_hospital(self, hospital_id: int) -> None:
+        """
+        Invalidate cached predictions for a hospital
+        
+        Must be called after any EHR record for the hospital is created or
+        updated so the next request retrains on the fresh data.
+        
+        Args:
+            hospital_id: Hospital whose EHR data changed
+        """
+        with self._cache_lock:
+            self._data_versions[hospital_id] = self._data_versions.get(hospital_id, 0) + 1
+            self._data_generation += 1
+    
+    @property
+    def data_generation(self) -> int:
+        """Counter that changes whenever any hospital's EHR data changes"""
+        return self._data_generation
+    
+    def cache_key(
+        self,
+        hospital_id: int,
+        ehr_records: List,
+        days: int,
+        uncertainty_samples: int = 1000
+    ) -> tuple:
+        """Build the prediction cache key for a hospital's current history"""
+        with self._cache_lock:
+            version = self._data_versions.get(hospital_id, 0)
+        return (
+            hospital_id,
+            version,
+            ehr_records[-1].date,
+            len(ehr_records),
+            days,
+            uncertainty_samples
+        )
+    
+    def get_cached_prediction(self, key: tuple) -> Optional[Tuple[List[Dict], Dict]]:
+        """Return a memoized prediction result, or None on a cache miss"""
+        with self._cache_lock:
+            cached = self._prediction_cache.get(key)
+            if cached is not None:
+                self._prediction_cache.move_to_end(key)
+            return cached
+    
+    def cache_prediction(self, key: tuple, result: Tuple[List[Dict], Dict]) -> None:
+        """Memoize a prediction result, evicting the least recently used entries"""
+        with self._cache_lock:
+            self._prediction_cache[key] = result
+            self._prediction_cache.move_to_end(key)
+            while len(self._prediction_cache) > PREDICTION_CACHE_SIZE:
+                self._prediction_cache.popitem(last=False)
+    
     def predict_occupancy(
         self,
         ehr_records: List,
-        days: int = 7
+        days: int = 7,
+        hospital_id: Optional[int] = None,
+        uncertainty_samples: int = 1000
     ) -> Tuple[List[Dict], Dict]:
         """
         Complete prediction pipeline: prepare data, train model, predict
         
+        When hospital_id is given, results are memoized per hospital, latest
+        record date, history length and horizon, so repeated requests skip
+        Prophet training until invalidate_hospital() is called.
+        
         Args:
             ehr_records: Historical EHR records from database
             days: Number of days to predict
+            hospital_id: Hospital the records belong to (enables caching)
+            uncertainty_samples: Prophet uncertainty simulations; pass 0 when
+                only the mean forecast is needed (bounds are returned as None)
             
         Returns:
             Tuple of (predictions list, model metadata)
@@ -147,23 +326,43 @@ class PredictionService:
         if len(ehr_records) < 14:
             raise ValueError("Need at least 14 days of historical data for reliable predictions")
         
-        # Prepare data
-        historical_data = self.prepare_data(ehr_records)
+        if hospital_id is None:
+            return self._run_prediction(ehr_records, days, uncertainty_samples)
         
-        # Train model
-        model_info = self.train_model(historical_data)
+        key = self.cache_key(hospital_id, ehr_records, days, uncertainty_samples)
+        cached = self.get_cached_prediction(key)
+        if cached is not None:
+            return cached
+        
+        result = self._run_prediction(ehr_records, days, uncertainty_samples, hospital_id)
+        self.cache_prediction(key, result)
+        return result
+    
+    def _run_prediction(
+        self,
+        ehr_records: List,
+        days: int,
+        uncertainty_samples: int = 1000,
+        hospital_id: Optional[int] = None
+    ) -> Tuple[List[Dict], Dict]:
+        """Fit (or reuse) a Prophet model for the records and predict the next `days` days"""
+        if hospital_id is None:
+            model, model_info = self._fit_model(self.prepare_data(ehr_records), uncertainty_samples)
+        else:
+            model, model_info = self.get_or_fit_model(hospital_id, ehr_records, uncertainty_samples)
         
         # Generate predictions
-        forecast = self.predict(days)
+        forecast = self._forecast(model, days)
         
-        # Format predictions
+        # Format predictions (Prophet omits interval columns without sampling)
+        with_bounds = uncertainty_samples > 0
         predictions = []
         for _, row in forecast.iterrows():
             predictions.append({
                 'date': row['ds'].date(),
                 'predicted_occupancy': max(0, round(row['yhat'])),  # Ensure non-negative
-                'lower_bound': max(0, round(row['yhat_lower'])),
-                'upper_bound': max(0, round(row['yhat_upper']))
+                'lower_bound': max(0, round(row['yhat_lower'])) if with_bounds else None,
+                'upper_bound': max(0, round(row['yhat_upper'])) if with_bounds else None
             })
         
         return predictions, model_info
@@ -213,28 +412,37 @@ class PredictionService:
         Returns:
             List of alert dictionaries
         """
+        if not predictions:
+            return []
+        
+        predicted = np.array([pred['predicted_occupancy'] for pred in predictions], dtype=np.float64)
+        
+        # Same thresholds as calculate_risk_level (no capacity -> green)
+        if total_beds > 0:
+            utilization = predicted / total_beds * 100
+        else:
+            utilization = np.zeros_like(predicted)
+        red_mask = utilization >= 85
+        yellow_mask = (utilization >= 70) & ~red_mask
+        
         alerts = []
         
-        for pred in predictions:
-            utilization = (pred['predicted_occupancy'] / total_beds) * 100
-            severity = self.calculate_risk_level(pred['predicted_occupancy'], total_beds)
-            
-            # Generate alert only for yellow/red severity
-            if severity in ['yellow', 'red']:
-                message = self._generate_alert_message(
+        # Generate alert only for yellow/red severity
+        for idx in np.flatnonzero(red_mask | yellow_mask):
+            severity = 'red' if red_mask[idx] else 'yellow'
+            util = float(utilization[idx])
+            alerts.append({
+                'date': predictions[idx]['date'],
+                'predicted_occupancy': float(predicted[idx]),
+                'utilization_percentage': round(util, 1),
+                'severity': severity,
+                'message': self._generate_alert_message(
                     severity,
-                    utilization,
-                    pred['date'],
+                    util,
+                    predictions[idx]['date'],
                     hospital_name
                 )
-                
-                alerts.append({
-                    'date': pred['date'],
-                    'predicted_occupancy': pred['predicted_occupancy'],
-                    'utilization_percentage': round(utilization, 1),
-                    'severity': severity,
-                    'message': message
-                })
+            })
         
         return alerts
     
@@ -262,5 +470,100 @@ class PredictionService:
             )
 
 
+def predict_from_history(
+    history: List[HistoryPoint],
+    days: int,
+    uncertainty_samples: int = 1000
+) -> Tuple[List[Dict], Dict]:
+    """
+    Run a single Prophet prediction in a worker process
+    
+    Module-level so it can be pickled by ProcessPoolExecutor. Uses a fresh
+    PredictionService because fitted model state is not shared across processes.
+    
+    Args:
+        history: Ordered (date, occupied_beds) points
+        days: Number of days to predict
+        uncertainty_samples: Prophet uncertainty simulations (0 for mean only)
+        
+    Returns:
+        Tuple of (predictions list, model metadata)
+    """
+    return PredictionService().predict_occupancy(
+        ehr_records=history,
+        days=days,
+        uncertainty_samples=uncertainty_samples
+    )
+
+
 # Singleton instance
 prediction_service = PredictionService()
+
+# Prophet training is CPU-bound, so multi-hospital requests fan out to processes.
+# The pool is created on first use and replaced if a worker dies.
+_prediction_pool: Optional[ProcessPoolExecutor] = None
+_prediction_pool_lock = threading.Lock()
+
+
+def _get_prediction_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, creating it on first use"""
+    global _prediction_pool
+    with _prediction_pool_lock:
+        if _prediction_pool is None:
+            _prediction_pool = ProcessPoolExecutor(
+                max_workers=PREDICTION_POOL_MAX_WORKERS,
+                mp_context=multiprocessing.get_context(PREDICTION_POOL_START_METHOD)
+            )
+        return _prediction_pool
+
+
+def _discard_prediction_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next request starts fresh workers"""
+    global _prediction_pool
+    with _prediction_pool_lock:
+        if _prediction_pool is pool:
+            _prediction_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_prediction_pool() -> None:
+    """Stop the worker processes, if any were started"""
+    global _prediction_pool
+    with _prediction_pool_lock:
+        pool, _prediction_pool = _prediction_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def predict_histories_in_pool(
+    histories: List[List[HistoryPoint]],
+    days: int,
+    uncertainty_samples: int = 1000
+) -> List:
+    """
+    Run predict_from_history for several hospitals in parallel worker processes
+    
+    Args:
+        histories: One (date, occupied_beds) history per hospital
+        days: Number of days to forecast
+        uncertainty_samples: Prophet uncertainty simulations (0 for mean only)
+        
+    Returns:
+        One (predictions, model_info) tuple per history, or the exception
+        raised for it. If the pool broke, it is replaced for later calls.
+    """
+    loop = asyncio.get_running_loop()
+    pool = _get_prediction_pool()
+    try:
+        futures = [
+            loop.run_in_executor(pool, predict_from_history, history, days, uncertainty_samples)
+            for history in histories
+        ]
+    except BrokenProcessPool as e:
+        _discard_prediction_pool(pool)
+        return [e] * len(histories)
+    
+    results = await asyncio.gather(*futures, return_exceptions=True)
+    if any(isinstance(result, BrokenProcessPool) for result in results):
+        _discard_prediction_pool(pool)
+    return results
@@ -0,0 +1,37 @@
+"""
+Indian hospital names, locations and capacity shared by the
+update_hospitals scripts
+"""
+
+from types import MappingProxyType
+from typing import Mapping, Union
+
+HospitalData = Mapping[str, Union[str, int]]
+
+# Keyed by hospital id; read-only views since this is a constant
+HOSPITALS: Mapping[int, HospitalData] = MappingProxyType({
+    1: MappingProxyType({
+        "hospital_name": "Apollo Hospitals",
+        "location": "Mumbai, Maharashtra",
+        "total_beds": 250,
+        "icu_beds": 30
+    }),
+    2: MappingProxyType({
+        "hospital_name": "Fortis Healthcare",
+        "location": "Delhi, NCR",
+        "total_beds": 180,
+        "icu_beds": 25
+    }),
+    3: MappingProxyType({
+        "hospital_name": "Max Super Speciality Hospital",
+        "location": "Bangalore, Karnataka",
+        "total_beds": 320,
+        "icu_beds": 40
+    }),
+    4: MappingProxyType({
+        "hospital_name": "AIIMS Hospital",
+        "location": "Hyderabad, Telangana",
+        "total_beds": 150,
+        "icu_beds": 20
+    })
+})
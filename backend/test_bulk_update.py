@@ -0,0 +1,57 @@
+"""Test that PATCH /api/hospitals renames show up on /compare"""
+import sys
+from fastapi.testclient import TestClient
+from app.main import app
+from app.database import SessionLocal
+from app.models.hospital import Hospital
+from app.services.auth_service import require_hospital_admin
+
+# Skip JWT login; the endpoint only needs an authenticated hospital admin
+app.dependency_overrides[require_hospital_admin] = lambda: None
+client = TestClient(app)
+
+db = SessionLocal()
+failed = False
+hospital = None
+
+try:
+    hospital = db.query(Hospital.id, Hospital.hospital_name, Hospital.location).order_by(Hospital.id).first()
+    if hospital is None:
+        print("✗ No hospitals in database; run generate_data.py first")
+        sys.exit(1)
+    
+    # Warm the comparison cache with the current name
+    before = client.get("/api/public/compare").json()
+    names_before = {c["hospital_id"]: c["hospital_name"] for c in before}
+    print(f"Hospital {hospital.id} on /compare: {names_before.get(hospital.id)}")
+    
+    new_name = f"{hospital.hospital_name} (renamed)"
+    response = client.patch("/api/hospitals", json=[
+        {"id": hospital.id, "hospital_name": new_name, "location": hospital.location}
+    ])
+    print(f"PATCH /api/hospitals: {response.status_code} {response.json()}")
+    failed = response.status_code != 200 or response.json()["updated"] != 1
+    
+    after = client.get("/api/public/compare").json()
+    name_after = {c["hospital_id"]: c["hospital_name"] for c in after}.get(hospital.id)
+    if name_after == new_name:
+        print(f"✓ /compare shows the new name: {name_after}")
+    else:
+        print(f"✗ /compare still shows: {name_after}")
+        failed = True
+    
+except Exception as e:
+    print(f"✗ Error: {e}")
+    import traceback
+    traceback.print_exc()
+    failed = True
+finally:
+    # Restore the original name
+    if hospital is not None:
+        client.patch("/api/hospitals", json=[
+            {"id": hospital.id, "hospital_name": hospital.hospital_name, "location": hospital.location}
+        ])
+    app.dependency_overrides.clear()
+    db.close()
+
+sys.exit(1 if failed else 0)
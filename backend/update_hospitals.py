@@ -2,9 +2,21 @@
 Update existing hospitals to Indian names and locations
 """
 
-import requests
+import argparse
+import asyncio
+import sys
+import httpx
+import ijson
+from indian_hospitals import HOSPITALS
 
 BASE_URL = "http://localhost:8000/api"
+LOGIN_URL = f"{BASE_URL}/auth/login"
+PUBLIC_HOSPITALS_URL = f"{BASE_URL}/public/hospitals"
+HOSPITALS_URL = f"{BASE_URL}/hospitals"
+
+# Shared keep-alive pool; caps concurrent requests against the API
+LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+TRANSPORT_RETRIES = 3
 
 # Login credentials (use hospital admin account)
 # Note: You may need to adjust these credentials based on your setup
@@ -13,68 +25,101 @@ LOGIN_DATA = {
     "password": "password123"
 }
 
-# New Indian hospital data
-INDIAN_HOSPITALS = [
-    {
-        "hospital_name": "Apollo Hospitals",
-        "location": "Mumbai, Maharashtra",
-        "total_beds": 250,
-        "icu_beds": 30
-    },
-    {
-        "hospital_name": "Fortis Healthcare",
-        "location": "Delhi, NCR",
-        "total_beds": 180,
-        "icu_beds": 25
-    },
-    {
-        "hospital_name": "Max Super Speciality Hospital",
-        "location": "Bangalore, Karnataka",
-        "total_beds": 320,
-        "icu_beds": 40
-    },
-    {
-        "hospital_name": "AIIMS Hospital",
-        "location": "Hyderabad, Telangana",
-        "total_beds": 150,
-        "icu_beds": 20
-    }
-]
+# Request body for PATCH /api/hospitals
+BULK_UPDATE = tuple(
+    {"id": hospital_id, "hospital_name": data["hospital_name"], "location": data["location"]}
+    for hospital_id, data in HOSPITALS.items()
+)
 
-def update_hospitals():
-    """Update existing hospitals with Indian names"""
+async def update_hospitals(apply: bool = False, verbose: bool = False):
+    """
+    Update existing hospitals with Indian names
+    
+    Without `apply` this is a dry run that only reports which hospitals
+    would change. Per-hospital details are printed only when `verbose`.
+    """
     
-    # Get all hospitals from public API
-    try:
-        response = requests.get(f"{BASE_URL}/public/hospitals")
+    transport = httpx.AsyncHTTPTransport(retries=TRANSPORT_RETRIES, limits=LIMITS)
+    async with httpx.AsyncClient(transport=transport, timeout=30.0) as client:
+        try:
+            if apply:
+                await _apply_updates(client, verbose)
+            else:
+                await _report_updates(client, verbose)
+        except Exception as e:
+            print(f"Error: {e}")
+
+
+async def _apply_updates(client: httpx.AsyncClient, verbose: bool):
+    """Send every hospital's new name and location in one bulk PATCH"""
+    # Updates require a hospital admin token
+    login = await client.post(LOGIN_URL, json=LOGIN_DATA)
+    if login.status_code != 200:
+        print(f"Failed to log in: {login.text}")
+        return
+    headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    
+    response = await client.patch(HOSPITALS_URL, json=BULK_UPDATE, headers=headers)
+    if response.status_code != 200:
+        print(f"Failed to update hospitals ({response.status_code}): {response.text}")
+        return
+    
+    result = response.json()
+    lines = []
+    if verbose:
+        lines.extend(
+            f"Hospital {item['id']}:\n  New: {item['hospital_name']} - {item['location']}\n\n"
+            for item in BULK_UPDATE
+            if item["id"] not in result["missing_ids"]
+        )
+    if result["missing_ids"]:
+        lines.append(f"✗ Not found: {', '.join(map(str, result['missing_ids']))}\n")
+    lines.append(f"{result['updated']}/{len(BULK_UPDATE)} hospitals updated\n")
+    sys.stdout.write("".join(lines))
+
+
+async def _report_updates(client: httpx.AsyncClient, verbose: bool):
+    """Dry run: compare the current hospital list with the new data"""
+    # Stream the hospital list and parse it incrementally instead of
+    # materializing the whole body
+    targets = []
+    found = 0
+    get_new_data = HOSPITALS.get
+    async with client.stream("GET", PUBLIC_HOSPITALS_URL) as response:
         if response.status_code != 200:
+            await response.aread()
             print(f"Failed to fetch hospitals: {response.text}")
             return
         
-        existing_hospitals = response.json()
-        print(f"Found {len(existing_hospitals)} existing hospitals\n")
-        
-        # Update each hospital
-        for i, hospital in enumerate(existing_hospitals):
-            if i < len(INDIAN_HOSPITALS):
-                hospital_id = hospital['id']
-                new_data = INDIAN_HOSPITALS[i]
-                
-                print(f"Hospital {hospital_id}:")
-                print(f"  Old: {hospital['hospital_name']} - {hospital['location']}")
-                print(f"  New: {new_data['hospital_name']} - {new_data['location']}")
-                
-                # Note: Update would require authentication
-                # For now, just show what would be updated
-                print(f"  ✓ Ready to update\n")
-        
-        print("\nTo apply these changes, you need to:")
-        print("1. Delete the database and recreate it, OR")
-        print("2. Manually update via SQL, OR")
-        print("3. Re-run generate_data.py to create new hospitals")
-        
-    except Exception as e:
-        print(f"Error: {e}")
+        parsed = ijson.sendable_list()
+        parser = ijson.items_coro(parsed, "item")
+        async for chunk in response.aiter_bytes():
+            parser.send(chunk)
+            for hospital in parsed:
+                found += 1
+                new_data = get_new_data(hospital["id"])
+                if new_data is not None:
+                    targets.append((hospital, new_data))
+            del parsed[:]
+        parser.close()
+    
+    if verbose:
+        sys.stdout.write("".join(
+            f"Hospital {hospital['id']}:\n"
+            f"  Old: {hospital['hospital_name']} - {hospital['location']}\n"
+            f"  New: {new_data['hospital_name']} - {new_data['location']}\n"
+            f"  ✓ Ready to update\n\n"
+            for hospital, new_data in targets
+        ))
+    sys.stdout.write(
+        f"{len(targets)}/{found} hospitals ready (dry run, pass --apply to update)\n"
+    )
 
 if __name__ == "__main__":
-    update_hospitals()
+    parser = argparse.ArgumentParser(description="Update existing hospitals to Indian names and locations")
+    parser.add_argument("-v", "--verbose", action="store_true", help="print per-hospital details")
+    parser.add_argument("--apply", action="store_true", help="send the updates (default is a dry run)")
+    args = parser.parse_args()
+    
+    asyncio.run(update_hospitals(apply=args.apply, verbose=args.verbose))
+    sys.stdout.flush()
@@ -9,68 +9,97 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-from app.database import SessionLocal
+from sqlalchemy import select, update, case, text
+from app.database import SessionLocal, init_db
 from app.models.hospital import Hospital
-from app.models.user import User  # Import User to resolve relationship
+from indian_hospitals import HOSPITALS
 
-# Indian hospital data
-INDIAN_HOSPITALS = {
-    1: {
-        "hospital_name": "Apollo Hospitals",
-        "location": "Mumbai, Maharashtra"
-    },
-    2: {
-        "hospital_name": "Fortis Healthcare",
-        "location": "Delhi, NCR"
-    },
-    3: {
-        "hospital_name": "Max Super Speciality Hospital",
-        "location": "Bangalore, Karnataka"
-    },
-    4: {
-        "hospital_name": "AIIMS Hospital",
-        "location": "Hyderabad, Telangana"
-    }
-}
+# Core table statements only, so the ORM mappers (and the User relationship)
+# never need to be configured
+hospitals_table = Hospital.__table__
 
 def update_hospitals():
     """Update hospital names and locations in database"""
-    db = SessionLocal()
-    
+    init_db()
     try:
-        hospitals = db.query(Hospital).all()
-        print(f"Found {len(hospitals)} hospitals in database\n")
-        
-        for hospital in hospitals:
-            if hospital.id in INDIAN_HOSPITALS:
-                old_name = hospital.hospital_name
-                old_location = hospital.location
+        # The context manager closes the session however the block exits.
+        # Nothing is read back through ORM objects, so skip expiring them on commit.
+        with SessionLocal(autoflush=False, expire_on_commit=False) as db:
+            # All hospitals in one UPDATE statement, picking each row's new values
+            # by id with CASE
+            names = {}
+            locations = {}
+            for hospital_id, data in HOSPITALS.items():
+                names[hospital_id] = data["hospital_name"]
+                locations[hospital_id] = data["location"]
+            
+            id_column = hospitals_table.c.id
+            name_case = case(names, value=id_column)
+            location_case = case(locations, value=id_column)
+            
+            # Explicit transaction; commits when the block exits. The script is
+            # idempotent, so skip waiting on the WAL flush at commit.
+            with db.begin():
+                db.execute(text("SET LOCAL synchronous_commit = OFF"))
+                
+                # Current values of the target rows, locked so the report
+                # matches what the UPDATE changes
+                existing = db.execute(
+                    select(id_column, hospitals_table.c.hospital_name, hospitals_table.c.location)
+                    .where(id_column.in_(list(HOSPITALS)))
+                    .order_by(id_column)
+                    .with_for_update()
+                ).all()
+                print(f"Found {len(existing)} of {len(HOSPITALS)} hospitals in database\n")
                 
-                # Update hospital
-                hospital.hospital_name = INDIAN_HOSPITALS[hospital.id]["hospital_name"]
-                hospital.location = INDIAN_HOSPITALS[hospital.id]["location"]
+                # Rows already holding these values are skipped entirely, so a
+                # re-run writes no new tuples
+                changed = [
+                    (hospital_id, old_name, old_location)
+                    for hospital_id, old_name, old_location in existing
+                    if (old_name, old_location) != (names[hospital_id], locations[hospital_id])
+                ]
+                sys.stdout.write("".join(
+                    f"Hospital ID {hospital_id}:\n"
+                    f"  Old: {old_name} - {old_location}\n"
+                    f"  New: {names[hospital_id]} - {locations[hospital_id]}\n\n"
+                    for hospital_id, old_name, old_location in changed
+                ))
                 
-                print(f"Hospital ID {hospital.id}:")
-                print(f"  Old: {old_name} - {old_location}")
-                print(f"  New: {hospital.hospital_name} - {hospital.location}")
-                print()
-        
-        # Commit changes
-        db.commit()
-        print("✓ All hospitals updated successfully!")
-        
-        # Verify
-        print("\nCurrent hospitals:")
-        hospitals = db.query(Hospital).all()
-        for h in hospitals:
-            print(f"  {h.id}: {h.hospital_name} - {h.location}")
-        
+                updated = 0
+                if changed:
+                    updated = db.execute(
+                        update(hospitals_table).where(
+                            id_column.in_([hospital_id for hospital_id, _, _ in changed])
+                        ).values(
+                            hospital_name=name_case,
+                            location=location_case
+                        )
+                    ).rowcount
+            
+            missing_ids = sorted(set(HOSPITALS) - {hospital_id for hospital_id, _, _ in existing})
+            if missing_ids:
+                print(f"✗ Not found in database: {', '.join(map(str, missing_ids))}")
+            if updated:
+                print(f"✓ {updated} hospitals updated successfully!")
+            else:
+                print("✓ All hospitals already up to date")
+            
+            # Verify only the rows that were touched
+            hospitals = db.execute(
+                select(hospitals_table.c.id, hospitals_table.c.hospital_name, hospitals_table.c.location)
+                .where(hospitals_table.c.id.in_(list(HOSPITALS)))
+                .order_by(hospitals_table.c.id)
+            ).all()
+            sys.stdout.write("\nCurrent hospitals:\n" + "".join(
+                f"  {hospital_id}: {name} - {location}\n" for hospital_id, name, location in hospitals
+            ))
+    
     except Exception as e:
+        # db.begin() has already rolled the transaction back
         print(f"Error updating hospitals: {e}")
-        db.rollback()
-    finally:
-        db.close()
 
 if __name__ == "__main__":
     print("Updating hospitals to Indian names and locations...\n")
     update_hospitals()
+    sys.stdout.flush()